@@ -1,14 +1,42 @@
+import hashlib
+import io
 import json
+import math
 import os
+import tempfile
+import threading
+import time
 import tkinter as tk
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from tkinter import filedialog, messagebox, ttk
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-import fitz  # PyMuPDF
+try:
+    import orjson
 
+    _dumps = orjson.dumps
+except ImportError:  # orjson is optional, the stdlib encoder is fine too
 
-@dataclass
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
+# PyMuPDF and the optional Pillow modules are imported by _load_pdf_modules()
+# when the first PDF is opened, keeping them off the startup path
+fitz = None
+Image = ImageTk = None
+
+# Our field type -> (PyMuPDF widget type, field flags, initial value),
+# filled in by _load_pdf_modules() since it needs the fitz constants
+_WIDGET_SPEC = None
+# PyMuPDF widget type -> our field type, for every type but text fields
+_WIDGET_TYPE_MAP = None
+
+
+@dataclass(slots=True)
 class FormField:
     """Represents a form field with its properties"""
 
@@ -17,7 +45,7 @@ class FormField:
     name: str
     page_num: int
     max_chars: int = 0  # For comb fields
-    options: List[str] = None  # For radio buttons
+    options: Optional[List[str]] = None  # For radio buttons
     # Appearance properties
     border_color: Tuple[float, float, float] = (0, 0, 0)  # RGB 0-1
     fill_color: Tuple[float, float, float] = (1, 1, 1)  # RGB 0-1
@@ -26,7 +54,200 @@ class FormField:
     font_color: Tuple[float, float, float] = (0, 0, 0)  # RGB 0-1
 
 
+@lru_cache(maxsize=256)
+def _rgb_to_hex(rgb: Tuple[float, float, float]) -> str:
+    """Convert RGB tuple (0-1) to hex color string"""
+    r, g, b = [int(c * 255) for c in rgb]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _load_pdf_modules():
+    """Import PyMuPDF, and Pillow if it is installed, on first use"""
+    global fitz, Image, ImageTk, _WIDGET_SPEC, _WIDGET_TYPE_MAP
+    if fitz is not None:
+        return
+
+    import fitz as pymupdf  # PyMuPDF
+
+    try:
+        from PIL import Image as pil_image
+        from PIL import ImageTk as pil_imagetk
+    except ImportError:  # Pillow is optional, fall back to Tk's PPM decoder
+        pass
+    else:
+        Image, ImageTk = pil_image, pil_imagetk
+
+    text = pymupdf.PDF_WIDGET_TYPE_TEXT
+    multiline = pymupdf.PDF_TX_FIELD_IS_MULTILINE
+    _WIDGET_SPEC = {
+        "text": (text, 0, None),
+        "multiline": (text, multiline, None),
+        "textarea": (text, multiline, None),
+        "checkbox": (pymupdf.PDF_WIDGET_TYPE_CHECKBOX, 0, "Off"),
+        "comb": (text, pymupdf.PDF_TX_FIELD_IS_COMB, None),
+        "radio": (pymupdf.PDF_WIDGET_TYPE_RADIOBUTTON, 0, "Off"),
+    }
+    _WIDGET_TYPE_MAP = {
+        pymupdf.PDF_WIDGET_TYPE_CHECKBOX: "checkbox",
+        pymupdf.PDF_WIDGET_TYPE_RADIOBUTTON: "radio",
+        pymupdf.PDF_WIDGET_TYPE_COMBOBOX: "text",  # Treat as text field
+        pymupdf.PDF_WIDGET_TYPE_LISTBOX: "textarea",  # Treat as text area
+    }
+
+    fitz = pymupdf
+
+
+@lru_cache(maxsize=16)
+def _zoom_matrix(zoom: float):
+    """Shared scaling matrix for rendering at the given zoom"""
+    return fitz.Matrix(zoom, zoom)
+
+
+def _text_subtype(widget):
+    """Our field type for a PyMuPDF text widget, from its flags and size"""
+    field_flags = widget.field_flags or 0
+    if field_flags & fitz.PDF_TX_FIELD_IS_COMB:
+        return "comb"
+    if field_flags & fitz.PDF_TX_FIELD_IS_MULTILINE:
+        # Distinguish between multiline and textarea based on size
+        rect = widget.rect
+        return "textarea" if rect.y1 - rect.y0 > 50 else "multiline"
+    return "text"
+
+
+def _parse_page_range(text, page_count):
+    """Turn "1-5, 8" into sorted 0-based page indices, or raise ValueError"""
+    pages = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        start = int(first)
+        end = int(last) if last else start
+        if not 1 <= start <= end <= page_count:
+            raise ValueError(f"page range out of bounds: {part}")
+        pages.update(range(start - 1, end))
+    if not pages:
+        raise ValueError("no pages given")
+    return sorted(pages)
+
+
+def _photo_bytes(photo):
+    """Memory taken by a tile image, counting 3 bytes per pixel"""
+    return photo.width() * photo.height() * 3
+
+
+def _trim_disk_cache(cache_dir, max_bytes, keep_dir):
+    """Delete the least recently written tiles beyond max_bytes, starting
+    with the least recently used documents"""
+    if keep_dir is not None:
+        try:
+            # Mark the open document's cache as most recently used
+            os.utime(keep_dir)
+        except OSError:
+            pass
+
+    def mtime(entry):
+        # Tiles can be replaced or deleted by a render thread meanwhile
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0
+
+    try:
+        doc_dirs = [entry for entry in os.scandir(cache_dir) if entry.is_dir()]
+    except OSError:
+        return
+
+    doc_dirs.sort(key=mtime, reverse=True)
+    total = 0
+    for doc_dir in doc_dirs:
+        try:
+            # Tiles still being written are left alone
+            tiles = [
+                entry
+                for entry in os.scandir(doc_dir.path)
+                if entry.is_file() and not entry.name.endswith(".tmp")
+            ]
+        except OSError:
+            continue
+
+        tiles.sort(key=mtime, reverse=True)
+        kept = 0
+        for tile in tiles:
+            try:
+                total += tile.stat().st_size
+                if total > max_bytes:
+                    os.remove(tile.path)
+                else:
+                    kept += 1
+            except OSError:
+                continue
+
+        if not kept and doc_dir.path != keep_dir:
+            try:
+                os.rmdir(doc_dir.path)
+            except OSError:
+                pass
+
+
 class PDFFormBuilder:
+    # Pages are rasterized in horizontal bands at most this many pixels tall,
+    # and only the bands near the visible part of the canvas are rendered.
+    # PyMuPDF holds the GIL while rendering, so short bands keep each pause
+    # of the Tk loop short.
+    _TILE_HEIGHT = 256
+
+    # Memory budget for rendered tiles, counted as 3 bytes per pixel. This
+    # holds about eight letter pages at the 150 DPI zoom limit.
+    _TILE_CACHE_BYTES = 48 << 20
+
+    # How often the Tk loop checks for finished renders
+    _RENDER_POLL_MS = 20
+
+    # Quiet time after a page change or finished tile before the neighboring
+    # pages are prefetched
+    _PREFETCH_DELAY_MS = 300
+
+    # Evicted tile images kept for reuse by later renders of the same size
+    _SPARE_PHOTOS = 4
+
+    # Size limit for rendered tiles kept on disk between sessions. It is
+    # enforced when a PDF is opened and again after every tenth of it written.
+    _DISK_CACHE_MAX_BYTES = 500 << 20
+
+    # Bumped whenever the tile layout on disk changes, so tiles cached by an
+    # older version are never shown
+    _DISK_CACHE_VERSION = 3
+
+    # Pages are rendered to fit the canvas width, within these limits. The
+    # upper limit is 150 DPI: wide windows gain nothing from denser pixmaps,
+    # and render cost grows with the square of the zoom.
+    _MIN_VIEW_WIDTH = 600
+    _MIN_ZOOM = 0.5
+    _MAX_ZOOM = 150 / 72
+
+    # Documents up to this many pages are scanned for existing fields on
+    # open; longer ones ask which pages to scan first
+    _DETECT_ALL_MAX_PAGES = 50
+
+    # Share of MuPDF's resource store freed whenever rendering moves on to
+    # another page. The store is unbounded by default and grows quickly on
+    # image-heavy PDFs; shrinking between bands of one page would make each
+    # band decode the page's images again.
+    _STORE_SHRINK_PERCENT = 20
+
+    # Overlay outline color per field type
+    _FIELD_COLORS = {
+        "text": "blue",
+        "multiline": "green",
+        "checkbox": "red",
+        "comb": "purple",
+        "radio": "orange",
+        "textarea": "cyan",
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("PDF Form Builder")
@@ -35,18 +256,93 @@ class PDFFormBuilder:
         self.pdf_doc = None
         self.current_page = 0
         self.fields = []
+        # Last number used in a generated field name
+        self._field_number = 0
+        # Indices into self.fields grouped by page number
+        self._fields_by_page: defaultdict[int, List[int]] = defaultdict(list)
+        # Pages already scanned for existing fields
+        self._scanned_pages = set()
+        # Fields read from each page of the open document, kept for rescans
+        self._widget_cache: dict[int, List[tuple]] = {}
         self.current_field_type = "text"
         self.selection_start = None
         self.temp_rect = None
+        self._drag_pending = False
+        self._drag_last_xy = (0, 0)
         self.selected_field_idx = None
+        self._appearance_after_id = None
+
+        # Canvas pixels per PDF point for the page on screen (and its inverse
+        # for canvas -> PDF conversion), and the canvas width it was fitted to
+        self._zoom = 150 / 72
+        self._inv_zoom = 72 / 150
+        self._view_width = None
+        self._resize_after_id = None
+        # Page (width, height) in PDF points, filled in as pages are rendered
+        self._page_sizes: dict[int, Tuple[float, float]] = {}
+        # Pixel size of the page on screen, and of the bands it is split into
+        self._page_pixels = (0, 0)
+        self._band_height = 1
+
+        # Tiles placed on the canvas for the current page, keyed by band
+        # index; field outlines are drawn over them
+        self._tile_items: dict[int, Tuple[int, tk.PhotoImage]] = {}
+        self._tiles_key = None  # (page_num, zoom) of _tile_items
+        self._tiles_after_id = None
+        self._prefetch_after_id = None
+
+        # Rendered tiles keyed by (page_num, zoom, band), oldest first. The
+        # zoom rather than the canvas width is part of the key, since every
+        # width that hits a zoom limit gives the same pixels.
+        self._tile_cache: OrderedDict[Tuple[int, float, int], tk.PhotoImage] = (
+            OrderedDict()
+        )
+        self._tile_cache_bytes = 0
+        # Evicted tile images that are off the canvas, oldest first. With
+        # bands at most _TILE_HEIGHT tall these add only a few MB.
+        self._spare_photos: List[tk.PhotoImage] = []
+
+        # Pages are rasterized on pool threads, so the Tk loop runs between
+        # bands (PyMuPDF keeps the GIL while rendering one); fitz calls hold
+        # _fitz_lock
+        self._render_pool = ThreadPoolExecutor(max_workers=2)
+        self._fitz_lock = threading.RLock()
+        # Renders queued or running, keyed like _tile_cache
+        self._in_flight: dict[Tuple[int, float, int], Future] = {}
+        # (document, page number) rendered last, guarded by _fitz_lock
+        self._store_page = None
+        # Tile bytes written to disk since the cache was last trimmed, guarded
+        # by _disk_lock since both render threads save tiles
+        self._disk_bytes_since_trim = 0
+        self._disk_lock = threading.Lock()
+
+        # Rendered tiles are also saved under a per-document directory here,
+        # unless disk_cache_enabled is turned off in the config
+        self.cache_dir = os.path.join(
+            os.path.expanduser("~"), ".pdf_form_builder_cache"
+        )
+        self._doc_cache_dir = None
 
         # Default style settings - will be loaded from config
         self.config_file = os.path.join(
             os.path.expanduser("~"), ".pdf_form_builder_config.json"
         )
+        # Set when the defaults differ from what is stored in the config file
+        self._styles_dirty = False
         self.load_default_styles()
 
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Stop background rendering and release the PDF before exiting"""
+        # Queued renders, tile writes and cache trims are dropped; a job already
+        # running is waited for, since it may hold _fitz_lock
+        self._render_pool.shutdown(cancel_futures=True)
+        if self.pdf_doc is not None:
+            self.pdf_doc.close()
+            self.pdf_doc = None
+        self.root.destroy()
 
     def setup_ui(self):
         # Top toolbar
@@ -65,6 +361,9 @@ class PDFFormBuilder:
         ttk.Button(
             toolbar, text="Default Style Settings", command=self.open_style_settings
         ).pack(side=tk.LEFT, padx=2)
+        ttk.Button(
+            toolbar, text="Detect Fields", command=self.detect_existing_fields
+        ).pack(side=tk.LEFT, padx=2)
 
         # Page navigation
         ttk.Label(toolbar, text="Page:").pack(side=tk.LEFT, padx=(20, 2))
@@ -143,7 +442,12 @@ class PDFFormBuilder:
             canvas_frame, orient=tk.HORIZONTAL, command=self.canvas.xview
         )
 
-        self.canvas.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        def on_yscroll(first, last):
+            v_scroll.set(first, last)
+            # Scrolling may bring unrendered tiles into view
+            self.schedule_visible_tiles()
+
+        self.canvas.configure(yscrollcommand=on_yscroll, xscrollcommand=h_scroll.set)
 
         v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
         h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
@@ -153,6 +457,7 @@ class PDFFormBuilder:
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_press)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_release)
+        self.canvas.bind("<Configure>", self.on_canvas_resize)
 
         # Right panel - Fields list and properties
         right_panel = ttk.Frame(main_container, width=350)
@@ -233,7 +538,7 @@ class PDFFormBuilder:
             increment=0.5,
             textvariable=self.border_width_var,
             width=10,
-            command=self.update_field_appearance,
+            command=self._schedule_appearance_update,
         ).grid(row=1, column=1, sticky=tk.W, padx=5, pady=5)
 
         # Font Size
@@ -248,7 +553,7 @@ class PDFFormBuilder:
             increment=1,
             textvariable=self.font_size_var,
             width=10,
-            command=self.update_field_appearance,
+            command=self._schedule_appearance_update,
         ).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
 
         # Border Color
@@ -312,17 +617,47 @@ class PDFFormBuilder:
             title="Select PDF", filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
         if filename:
+            self._flush_appearance_update()
             try:
-                self.pdf_doc = fitz.open(filename)
+                _load_pdf_modules()
+                with self._fitz_lock:
+                    new_doc = fitz.open(filename)
+                    # Release the previous document instead of waiting for GC
+                    if self.pdf_doc is not None:
+                        self.pdf_doc.close()
+                    self.pdf_doc = new_doc
+                for future in self._in_flight.values():
+                    future.cancel()
+                self._in_flight.clear()
+                self._tile_cache.clear()
+                self._tile_cache_bytes = 0
+                self._page_sizes.clear()
+                self._tiles_key = None
+                self._doc_cache_dir = self._disk_cache_dir_for(filename)
+                if self._doc_cache_dir is not None:
+                    self._render_pool.submit(
+                        _trim_disk_cache,
+                        self.cache_dir,
+                        self._DISK_CACHE_MAX_BYTES,
+                        self._doc_cache_dir,
+                    )
                 self.current_page = 0
                 self.fields = []
+                self._field_number = 0
+                self._fields_by_page.clear()
+                self._scanned_pages.clear()
+                self._widget_cache.clear()
                 self.selected_field_idx = None
-                self.page_label.config(text=f"/ {len(self.pdf_doc)}")
+                page_count = len(self.pdf_doc)
+                self.page_label.config(text=f"/ {page_count}")
 
                 # Automatically detect existing fields
-                self.detect_existing_fields()
+                if page_count <= self._DETECT_ALL_MAX_PAGES:
+                    self.detect_existing_fields(range(page_count))
+                else:
+                    self.detect_existing_fields()
 
-                # Render page (will be called again in detect_existing_fields, but that's okay)
+                # Render page
                 self.render_page()
                 self.update_fields_list()
             except Exception as e:
@@ -332,75 +667,470 @@ class PDFFormBuilder:
         if not self.pdf_doc:
             return
 
-        page = self.pdf_doc[self.current_page]
-
-        # Render at 150 DPI for better quality
-        mat = fitz.Matrix(150 / 72, 150 / 72)
-        pix = page.get_pixmap(matrix=mat)
-
-        # Convert to PhotoImage
-        img_data = pix.tobytes("ppm")
-        self.photo = tk.PhotoImage(data=img_data)
+        self._view_width = max(self.canvas.winfo_width(), self._MIN_VIEW_WIDTH)
+        self._zoom = self._page_zoom(self.current_page, self._view_width)
+        self._inv_zoom = 1 / self._zoom
+        page_width, page_height = self._page_sizes[self.current_page]
+        self._page_pixels = (
+            math.ceil(page_width * self._zoom),
+            math.ceil(page_height * self._zoom),
+        )
+        self._band_height = self._band_height_for(self._page_pixels[1])
 
-        # Update canvas
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
-        self.canvas.config(scrollregion=self.canvas.bbox(tk.ALL))
+        # Update canvas - tiles are placed as they become visible and the
+        # field overlay is rebuilt by draw_fields
+        self.canvas.delete("temp_rect")
+        self.temp_rect = None
+        tiles_key = (self.current_page, self._zoom)
+        if tiles_key != self._tiles_key:
+            # Tiles already on the canvas stay put when re-rendering the
+            # same page, e.g. after a field edit
+            self.canvas.delete("tile")
+            self._tile_items = {}
+            self._tiles_key = tiles_key
+            # The page's pixel size only depends on the page and zoom, so the
+            # scroll region only changes along with the tiles
+            self.canvas.config(scrollregion=(0, 0, *self._page_pixels))
+
+        # Drop queued renders for pages the user has moved away from
+        for (page_num, _, _), future in self._in_flight.items():
+            if abs(page_num - self.current_page) > 1:
+                future.cancel()
+
+        self.show_visible_tiles()
 
         # Draw existing fields for this page
         self.draw_fields()
 
-    def draw_fields(self):
-        """Draw rectangles for existing fields on current page"""
+        self.schedule_prefetch()
+
+    def schedule_prefetch(self):
+        """Prefetch the neighboring pages once rendering has gone quiet"""
+        # Rendering holds the GIL, so prefetching while the current page is
+        # still coming in or the user is paging on would stall the UI further
+        if self._prefetch_after_id is not None:
+            self.root.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.root.after(
+            self._PREFETCH_DELAY_MS, self._run_prefetch
+        )
+
+    def _run_prefetch(self):
+        self._prefetch_after_id = None
+        if self.pdf_doc:
+            self.prefetch_neighbors()
+
+    def prefetch_neighbors(self):
+        """Queue renders of the visible region of the neighboring pages"""
+        # Users mostly step one page at a time, so warm up the same region of
+        # the neighbors. The pool is FIFO, so these queue behind this page.
+        # A neighbor's zoom needs its size, which the render worker records
+        # while rendering this page; until then the neighbor is skipped.
+        for page_num in (self.current_page + 1, self.current_page - 1):
+            page_size = self._page_sizes.get(page_num)
+            if page_size is None:
+                continue
+            zoom = self._fit_zoom(page_size[0], self._view_width)
+            height_px = math.ceil(page_size[1] * zoom)
+            band_count = math.ceil(height_px / self._band_height_for(height_px))
+            for band in self._visible_bands():
+                if band >= band_count:
+                    break
+                neighbor_key = (page_num, zoom, band)
+                if neighbor_key not in self._tile_cache:
+                    self.request_render(neighbor_key)
+
+    def _band_height_for(self, page_height_px):
+        """Height of the bands a page this many pixels tall is rendered in"""
+        # Equal bands, so the last one is not a thin sliver
+        band_count = max(math.ceil(page_height_px / self._TILE_HEIGHT), 1)
+        return max(math.ceil(page_height_px / band_count), 1)
+
+    def _visible_bands(self):
+        """Tile bands of the current page overlapping the visible canvas area"""
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        band_height = self._band_height
+        band_count = max(math.ceil(self._page_pixels[1] / band_height), 1)
+
+        # One band of margin on each side so short scrolls hit ready tiles
+        first = max(int(top // band_height) - 1, 0)
+        last = min(int(bottom // band_height) + 1, band_count - 1)
+        return range(first, last + 1)
+
+    def schedule_visible_tiles(self):
+        """Coalesce scroll/resize notifications into one tile update"""
+        if self._tiles_after_id is None:
+            self._tiles_after_id = self.root.after_idle(self._run_visible_tiles)
+
+    def _run_visible_tiles(self):
+        self._tiles_after_id = None
+        if self.pdf_doc:
+            self.show_visible_tiles()
+
+    def show_visible_tiles(self):
+        """Place cached tiles in view and queue renders for missing ones"""
+        for band in self._visible_bands():
+            if band in self._tile_items:
+                continue
+
+            key = (self.current_page, self._zoom, band)
+            photo = self._tile_cache.get(key)
+            if photo is None:
+                self.request_render(key)
+            else:
+                self._tile_cache.move_to_end(key)
+                self.place_tile(band, photo)
+
+        self.update_rendering_placeholder()
+
+    def place_tile(self, band, photo):
+        """Put a rendered tile on the canvas below the field overlay"""
+        if band in self._tile_items:
+            return
+
+        item_id = self.canvas.create_image(
+            0, band * self._band_height, anchor=tk.NW, image=photo, tags="tile"
+        )
+        self.canvas.tag_lower(item_id)
+        # Keep a reference so Tk doesn't drop the image
+        self._tile_items[band] = (item_id, photo)
+
+    def update_rendering_placeholder(self):
+        """Show a placeholder until the first tile of the page is on screen"""
+        self.canvas.delete("rendering")
+        if not self._tile_items:
+            self.canvas.create_text(
+                20,
+                20,
+                anchor=tk.NW,
+                text="Rendering...",
+                fill="white",
+                font=("Arial", 12),
+                tags="rendering",
+            )
+
+    def _fit_zoom(self, page_width, view_width):
+        """Scale that fits a page of the given width into the view width"""
+        zoom = view_width / page_width
+        return min(max(zoom, self._MIN_ZOOM), self._MAX_ZOOM)
+
+    def _page_zoom(self, page_num, view_width):
+        """Canvas pixels per PDF point for a page fitted to the view width"""
+        page_size = self._page_sizes.get(page_num)
+        if page_size is None:
+            with self._fitz_lock:
+                rect = self.pdf_doc[page_num].rect
+            page_size = self._page_sizes[page_num] = (rect.width, rect.height)
+        return self._fit_zoom(page_size[0], view_width)
+
+    def on_canvas_resize(self, event):
+        """Re-fit the page to a resized canvas once resizing settles"""
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(200, self._apply_canvas_resize)
+
+    def _apply_canvas_resize(self):
+        self._resize_after_id = None
         if not self.pdf_doc:
             return
 
-        page = self.pdf_doc[self.current_page]
-        mat = fitz.Matrix(150 / 72, 150 / 72)
-
-        for i, field in enumerate(self.fields):
-            if field.page_num == self.current_page:
-                # Convert PDF coordinates to canvas coordinates
-                rect = field.rect
-                x0, y0, x1, y1 = rect
-
-                # Transform coordinates
-                x0_c = x0 * mat.a
-                y0_c = y0 * mat.d
-                x1_c = x1 * mat.a
-                y1_c = y1 * mat.d
-
-                # Choose color based on field type
-                colors = {
-                    "text": "blue",
-                    "multiline": "green",
-                    "checkbox": "red",
-                    "comb": "purple",
-                    "radio": "orange",
-                    "textarea": "cyan",
-                }
-                color = colors.get(field.field_type, "blue")
-
-                # Highlight selected field
-                width = 3 if i == self.selected_field_idx else 2
-
-                # Create clickable rectangle with tag
-                rect_id = self.canvas.create_rectangle(
-                    x0_c,
-                    y0_c,
-                    x1_c,
-                    y1_c,
-                    outline=color,
-                    width=width,
-                    tags=f"field_{i}",
+        view_width = max(self.canvas.winfo_width(), self._MIN_VIEW_WIDTH)
+        if view_width == self._view_width:
+            return
+        if self._page_zoom(self.current_page, view_width) == self._zoom:
+            # The zoom is at a limit, so the tiles are unchanged; only a
+            # taller canvas may bring more bands into view
+            self._view_width = view_width
+            self.schedule_visible_tiles()
+            return
+
+        # Renders at the old zoom are no longer useful
+        for future in self._in_flight.values():
+            future.cancel()
+        self._tile_cache.clear()
+        self._tile_cache_bytes = 0
+        self.render_page()
+
+    def _disk_cache_dir_for(self, filename):
+        """Tile cache directory for a PDF, named after a hash of its content,
+        or None if the disk cache is turned off"""
+        if not self.disk_cache_enabled:
+            return None
+        try:
+            with open(filename, "rb") as f:
+                stat = os.fstat(f.fileno())
+                head = f.read(65536)
+                # The tail holds the trailer with the document /ID, and the
+                # changes appended by incremental saves
+                f.seek(max(stat.st_size - 65536, len(head)))
+                tail = f.read()
+        except OSError:
+            return None
+
+        # The size and modification time tell apart files with the same head
+        # and tail, e.g. a form refilled in place
+        stamp = f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+        digest = hashlib.sha1(head + tail + stamp).hexdigest()
+        return os.path.join(self.cache_dir, digest)
+
+    def set_disk_cache_enabled(self, enabled):
+        """Turn the disk tile cache on or off, deleting it when turned off"""
+        self.disk_cache_enabled = enabled
+        if self.pdf_doc is not None:
+            self._doc_cache_dir = self._disk_cache_dir_for(self.pdf_doc.name)
+        if not enabled:
+            # Queued behind the tile writes already submitted
+            self._render_pool.submit(_trim_disk_cache, self.cache_dir, 0, None)
+
+    def request_render(self, key):
+        """Queue rasterization of a (page_num, zoom, band) tile"""
+        future = self._in_flight.get(key)
+        if future is not None and not future.cancelled():
+            return
+
+        doc = self.pdf_doc
+        future = self._render_pool.submit(
+            self._rasterize, doc, self._doc_cache_dir, *key
+        )
+        self._in_flight[key] = future
+        self.root.after(self._RENDER_POLL_MS, self._poll_render, doc, key, future)
+
+    def _poll_render(self, doc, key, future):
+        """Wait for a queued render from the Tk event loop (main thread)"""
+        # Polling keeps every Tk call on this thread; a done-callback would
+        # run on the render thread
+        if future.done():
+            self._on_render_done(doc, key, future)
+        else:
+            self.root.after(self._RENDER_POLL_MS, self._poll_render, doc, key, future)
+
+    def _rasterize(self, doc, cache_dir, page_num, zoom, band):
+        """Render one tile of a page to image data, or None if the band lies
+        below the page (runs on a render pool thread)"""
+        tile_path = None
+        if cache_dir is not None:
+            # The band layout follows from the zoom and _TILE_HEIGHT. Without
+            # Pillow, tiles are stored as PPM, which Tk reads directly.
+            ext = "ppm" if ImageTk is None else "png"
+            tile_path = os.path.join(
+                cache_dir,
+                f"v{self._DISK_CACHE_VERSION}_p{page_num}_z{zoom:.6f}"
+                f"_h{self._TILE_HEIGHT}_t{band}.{ext}",
+            )
+            try:
+                with open(tile_path, "rb") as f:
+                    data = f.read()
+            except OSError:
+                pass
+            else:
+                # Prefetching needs the sizes on a warm cache too
+                with self._fitz_lock:
+                    if self._record_page_sizes(doc, page_num) is None:
+                        return None
+                if ImageTk is None:
+                    return data
+                img = Image.open(io.BytesIO(data))
+                img.load()
+                return img
+
+        # PyMuPDF is not thread-safe, so doc access is serialized
+        with self._fitz_lock:
+            page = self._record_page_sizes(doc, page_num)
+            if page is None:
+                return None
+            rect = page.rect
+
+            band_height = self._band_height_for(math.ceil(rect.height * zoom))
+            top = band * band_height / zoom
+            if top >= rect.height:
+                return None
+            bottom = min((band + 1) * band_height / zoom, rect.height)
+            clip = fitz.Rect(0, top, rect.width, bottom)
+
+            if self._store_page is not None and self._store_page != (doc, page_num):
+                fitz.TOOLS.store_shrink(self._STORE_SHRINK_PERCENT)
+            self._store_page = (doc, page_num)
+
+            pix = page.get_pixmap(matrix=_zoom_matrix(zoom), clip=clip)
+            if ImageTk is None:
+                data = tile_data = pix.tobytes("ppm")
+            else:
+                data = pix
+                # A copy, since the pixmap's buffer backs the displayed image
+                tile_data = (pix.width, pix.height, pix.samples)
+
+        if tile_path is not None:
+            # The cache entry is written by a later job, so the tile is shown
+            # without waiting for it to be encoded
+            self._render_pool.submit(self._save_tile, tile_data, tile_path, cache_dir)
+        return data
+
+    def _record_page_sizes(self, doc, page_num):
+        """Record the size of a page and its neighbors and return the page, or
+        None if another PDF was opened meanwhile (caller holds _fitz_lock)"""
+        if doc is not self.pdf_doc:
+            # Its page sizes must not be mixed up with the new PDF's
+            return None
+        page = doc[page_num]
+        rect = page.rect
+        self._page_sizes[page_num] = (rect.width, rect.height)
+        # Record the neighbors' sizes too, so their zoom is known when
+        # prefetching them
+        for neighbor in (page_num - 1, page_num + 1):
+            if 0 <= neighbor < len(doc) and neighbor not in self._page_sizes:
+                neighbor_rect = doc[neighbor].rect
+                self._page_sizes[neighbor] = (neighbor_rect.width, neighbor_rect.height)
+        return page
+
+    def _save_tile(self, tile_data, tile_path, cache_dir):
+        """Write a rendered tile to the disk cache (runs on a render pool
+        thread, without holding _fitz_lock)"""
+        # Write under a temporary name so readers never see a partial file
+        tmp_path = f"{tile_path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(tile_path), exist_ok=True)
+            if ImageTk is None:
+                with open(tmp_path, "wb") as f:
+                    f.write(tile_data)
+            else:
+                # Pillow releases the GIL while encoding, unlike PyMuPDF
+                width, height, samples = tile_data
+                Image.frombytes("RGB", (width, height), samples).save(
+                    tmp_path, format="PNG"
+                )
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, tile_path)
+        except Exception as e:
+            print(f"Error caching page tile: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._disk_lock:
+            self._disk_bytes_since_trim += size
+            trim = self._disk_bytes_since_trim > self._DISK_CACHE_MAX_BYTES // 10
+            if trim:
+                self._disk_bytes_since_trim = 0
+        if trim:
+            # A long session on one big PDF must stay within the limit too
+            _trim_disk_cache(self.cache_dir, self._DISK_CACHE_MAX_BYTES, cache_dir)
+
+    def _on_render_done(self, doc, key, future):
+        """Cache a finished tile and display it if still current (main thread)"""
+        if doc is not self.pdf_doc:
+            return
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled():
+            return
+
+        try:
+            data = future.result()
+        except Exception as e:
+            print(f"Error rendering page: {str(e)}")
+            return
+        if data is None:
+            return
+
+        # Convert to PhotoImage - Tk objects are only touched on this thread
+        if ImageTk is not None:
+            if isinstance(data, Image.Image):
+                # Tile loaded from the disk cache
+                img = data
+            else:
+                # Wrap the pixmap buffer directly instead of encoding to PPM
+                img = Image.frombuffer(
+                    "RGB",
+                    (data.width, data.height),
+                    data.samples_mv,
+                    "raw",
+                    "RGB",
+                    data.stride,
+                    1,
                 )
+            photo = self._reuse_photo(img.size)
+            if photo is None:
+                photo = ImageTk.PhotoImage(img)
+            else:
+                photo.paste(img)
+        else:
+            # PPM from a fresh render or PNG from the disk cache
+            photo = tk.PhotoImage(data=data)
+
+        replaced = self._tile_cache.pop(key, None)
+        if replaced is not None:
+            self._tile_cache_bytes -= _photo_bytes(replaced)
+        self._tile_cache[key] = photo
+        self._tile_cache_bytes += _photo_bytes(photo)
+        # The newest tile is always kept, however large
+        while (
+            self._tile_cache_bytes > self._TILE_CACHE_BYTES
+            and len(self._tile_cache) > 1
+        ):
+            _, evicted = self._tile_cache.popitem(last=False)
+            self._tile_cache_bytes -= _photo_bytes(evicted)
+            self._keep_spare_photo(evicted)
+
+        page_num, zoom, band = key
+        if (page_num, zoom) == (self.current_page, self._zoom):
+            self.place_tile(band, photo)
+            self.update_rendering_placeholder()
+            self.schedule_prefetch()
+
+    def _reuse_photo(self, size):
+        """Take a spare tile image of the given size, or None"""
+        for i, photo in enumerate(self._spare_photos):
+            if (photo.width(), photo.height()) == size:
+                return self._spare_photos.pop(i)
+        return None
+
+    def _keep_spare_photo(self, photo):
+        """Keep an evicted tile image for reuse unless it is still on screen"""
+        # Only Pillow images can be repainted in place
+        if ImageTk is None or not isinstance(photo, ImageTk.PhotoImage):
+            return
+        if any(placed is photo for _, placed in self._tile_items.values()):
+            return
+        self._spare_photos.append(photo)
+        if len(self._spare_photos) > self._SPARE_PHOTOS:
+            del self._spare_photos[0]
+
+    def draw_fields(self):
+        """Draw rectangles for existing fields on current page"""
+        self.canvas.delete("overlay")
+        if not self.pdf_doc:
+            return
 
-                # Bind click event to the rectangle
-                self.canvas.tag_bind(
+        zoom = self._zoom
+        colors = self._FIELD_COLORS
+        selected = self.selected_field_idx
+        fields = self.fields
+
+        # Convert PDF coordinates to canvas coordinates and pick the outline
+        # color and width (selected field is highlighted) in one pass
+        items = []
+        for i in self._fields_by_page.get(self.current_page, ()):
+            field = fields[i]
+            x0, y0, x1, y1 = field.rect
+            items.append(
+                (
+                    x0 * zoom,
+                    y0 * zoom,
+                    x1 * zoom,
+                    y1 * zoom,
+                    colors.get(field.field_type, "blue"),
+                    3 if i == selected else 2,
                     f"field_{i}",
-                    "<Button-1>",
-                    lambda event, idx=i: self.select_field_from_canvas(idx),
                 )
+            )
+
+        # Clicks on a rectangle are handled by on_mouse_press, so the items
+        # need no bindings of their own
+        create_rectangle = self.canvas.create_rectangle
+        for x0, y0, x1, y1, color, width, tag in items:
+            create_rectangle(
+                x0, y0, x1, y1, outline=color, width=width, tags=("overlay", tag)
+            )
 
     def on_mouse_press(self, event):
         if not self.pdf_doc:
@@ -418,32 +1148,33 @@ class PDFFormBuilder:
             # Don't start new field creation
             self.selection_start = None
         else:
-            # Start creating new field
+            # Start creating new field - the selection rectangle is created
+            # here and only moved while dragging
             self.selection_start = (x, y)
+            self.canvas.delete("temp_rect")
+            self.temp_rect = self._create_temp_rect(x, y, x, y)
 
     def get_field_at_position(self, canvas_x, canvas_y):
         """Get the index of the field at the given canvas position"""
         if not self.pdf_doc:
             return None
 
-        mat = fitz.Matrix(150 / 72, 150 / 72)
-
         # Convert canvas coordinates to PDF coordinates
-        pdf_x = canvas_x / mat.a
-        pdf_y = canvas_y / mat.d
+        pdf_x = canvas_x * self._inv_zoom
+        pdf_y = canvas_y * self._inv_zoom
 
-        # Check fields in reverse order (top fields first)
-        for i in range(len(self.fields) - 1, -1, -1):
-            field = self.fields[i]
-            if field.page_num == self.current_page:
-                x0, y0, x1, y1 = field.rect
-                if x0 <= pdf_x <= x1 and y0 <= pdf_y <= y1:
-                    return i
+        # Check this page's fields in reverse order (top fields first)
+        for i in reversed(self._fields_by_page.get(self.current_page, ())):
+            x0, y0, x1, y1 = self.fields[i].rect
+            if x0 <= pdf_x <= x1 and y0 <= pdf_y <= y1:
+                return i
 
         return None
 
     def select_field_from_canvas(self, field_idx):
         """Select a field by clicking on it in the canvas"""
+        self._flush_appearance_update()
+        previous_idx = self.selected_field_idx
         self.selected_field_idx = field_idx
 
         # Update listbox selection
@@ -458,28 +1189,48 @@ class PDFFormBuilder:
         self.font_size_var.set(str(field.font_size))
 
         # Update color buttons
-        self.border_color_btn.config(bg=self.rgb_to_hex(field.border_color))
-        self.fill_color_btn.config(bg=self.rgb_to_hex(field.fill_color))
-        self.font_color_btn.config(bg=self.rgb_to_hex(field.font_color))
+        self.border_color_btn.config(bg=_rgb_to_hex(tuple(field.border_color)))
+        self.fill_color_btn.config(bg=_rgb_to_hex(tuple(field.fill_color)))
+        self.font_color_btn.config(bg=_rgb_to_hex(tuple(field.font_color)))
 
         self.info_label.config(text=f"Editing: {field.name} ({field.field_type})")
 
-        # Redraw to highlight selected field
-        self.render_page()
+        # Highlight selected field
+        self.highlight_field(previous_idx, field_idx)
 
     def on_mouse_drag(self, event):
         if not self.pdf_doc or not self.selection_start:
             return
 
-        # Remove previous temp rectangle
-        self.canvas.delete("temp_rect")
+        # Motion events can arrive far faster than the screen refreshes, so
+        # remember the latest position and repaint at most every 16 ms
+        self._drag_last_xy = (
+            self.canvas.canvasx(event.x),
+            self.canvas.canvasy(event.y),
+        )
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.root.after(16, self._do_drag_repaint)
 
-        # Draw current selection
+    def _do_drag_repaint(self):
+        self._drag_pending = False
+        if not self.selection_start:
+            # Mouse was released in the meantime
+            return
+
+        # Move the selection rectangle to the current position
         x0, y0 = self.selection_start
-        x1 = self.canvas.canvasx(event.x)
-        y1 = self.canvas.canvasy(event.y)
+        x1, y1 = self._drag_last_xy
+
+        if self.temp_rect is None:
+            # The page was redrawn mid-drag
+            self.temp_rect = self._create_temp_rect(x0, y0, x1, y1)
+        else:
+            self.canvas.coords(self.temp_rect, x0, y0, x1, y1)
 
-        self.canvas.create_rectangle(
+    def _create_temp_rect(self, x0, y0, x1, y1):
+        """Draw the dashed rectangle that shows a selection in progress"""
+        return self.canvas.create_rectangle(
             x0, y0, x1, y1, outline="yellow", width=2, dash=(5, 5), tags="temp_rect"
         )
 
@@ -492,6 +1243,7 @@ class PDFFormBuilder:
             return
 
         self.canvas.delete("temp_rect")
+        self.temp_rect = None
 
         x0, y0 = self.selection_start
         x1 = self.canvas.canvasx(event.x)
@@ -509,14 +1261,14 @@ class PDFFormBuilder:
             y0, y1 = y1, y0
 
         # Convert canvas coordinates to PDF coordinates
-        mat = fitz.Matrix(150 / 72, 150 / 72)
-        pdf_x0 = x0 / mat.a
-        pdf_y0 = y0 / mat.d
-        pdf_x1 = x1 / mat.a
-        pdf_y1 = y1 / mat.d
+        inv_zoom = self._inv_zoom
+        pdf_x0 = x0 * inv_zoom
+        pdf_y0 = y0 * inv_zoom
+        pdf_x1 = x1 * inv_zoom
+        pdf_y1 = y1 * inv_zoom
 
         # Create field
-        field_name = f"{self.current_field_type}_{len(self.fields) + 1}"
+        field_name = self._next_field_name(self.current_field_type)
 
         field = FormField(
             field_type=self.current_field_type,
@@ -533,17 +1285,30 @@ class PDFFormBuilder:
             font_size=self.default_font_size,
         )
 
-        self.fields.append(field)
+        self.add_field(field)
         self.selection_start = None
 
-        # Redraw
-        self.render_page()
+        # Redraw the overlay - the page image is unchanged
+        self.draw_fields()
         self.update_fields_list()
 
+    def _next_field_name(self, prefix):
+        """Generated name for a new field, numbered so no name repeats"""
+        # Counting the fields would hand out a name again after a deletion
+        self._field_number += 1
+        return f"{prefix}_{self._field_number}"
+
+    def add_field(self, field):
+        """Append a field and record it in the per-page index"""
+        self._fields_by_page[field.page_num].append(len(self.fields))
+        self.fields.append(field)
+
     def on_field_select(self, event):
         """Handle field selection from listbox"""
         selection = self.fields_listbox.curselection()
         if selection:
+            self._flush_appearance_update()
+            previous_idx = self.selected_field_idx
             self.selected_field_idx = selection[0]
             field = self.fields[self.selected_field_idx]
 
@@ -553,14 +1318,21 @@ class PDFFormBuilder:
             self.font_size_var.set(str(field.font_size))
 
             # Update color buttons
-            self.border_color_btn.config(bg=self.rgb_to_hex(field.border_color))
-            self.fill_color_btn.config(bg=self.rgb_to_hex(field.fill_color))
-            self.font_color_btn.config(bg=self.rgb_to_hex(field.font_color))
+            self.border_color_btn.config(bg=_rgb_to_hex(tuple(field.border_color)))
+            self.fill_color_btn.config(bg=_rgb_to_hex(tuple(field.fill_color)))
+            self.font_color_btn.config(bg=_rgb_to_hex(tuple(field.font_color)))
 
             self.info_label.config(text=f"Editing: {field.name} ({field.field_type})")
 
-            # Redraw to highlight selected field
-            self.render_page()
+            # Highlight selected field
+            self.highlight_field(previous_idx, self.selected_field_idx)
+
+    def highlight_field(self, previous_idx, field_idx):
+        """Move the selection outline from one field rectangle to another"""
+        if previous_idx is not None:
+            self.canvas.itemconfig(f"field_{previous_idx}", width=2)
+        if field_idx is not None:
+            self.canvas.itemconfig(f"field_{field_idx}", width=3)
 
     def update_field_name(self):
         """Update the name of the selected field"""
@@ -573,6 +1345,23 @@ class PDFFormBuilder:
             else:
                 messagebox.showwarning("Invalid Name", "Field name cannot be empty")
 
+    def _schedule_appearance_update(self):
+        """Coalesce rapid spinbox changes into one appearance update"""
+        if self._appearance_after_id is not None:
+            self.root.after_cancel(self._appearance_after_id)
+        self._appearance_after_id = self.root.after(100, self._run_appearance_update)
+
+    def _run_appearance_update(self):
+        self._appearance_after_id = None
+        self.update_field_appearance()
+
+    def _flush_appearance_update(self):
+        """Apply a pending appearance update now, before the selection changes
+        and it would land on another field"""
+        if self._appearance_after_id is not None:
+            self.root.after_cancel(self._appearance_after_id)
+            self._run_appearance_update()
+
     def update_field_appearance(self):
         """Update the appearance properties of the selected field"""
         if self.selected_field_idx is not None:
@@ -600,11 +1389,11 @@ class PDFFormBuilder:
 
         # Get current color
         if color_type == "border":
-            current = self.rgb_to_hex(field.border_color)
+            current = _rgb_to_hex(tuple(field.border_color))
         elif color_type == "fill":
-            current = self.rgb_to_hex(field.fill_color)
+            current = _rgb_to_hex(tuple(field.fill_color))
         else:  # font
-            current = self.rgb_to_hex(field.font_color)
+            current = _rgb_to_hex(tuple(field.font_color))
 
         # Open color chooser
         color = colorchooser.askcolor(
@@ -624,11 +1413,6 @@ class PDFFormBuilder:
                 field.font_color = rgb_normalized
                 self.font_color_btn.config(bg=color[1])
 
-    def rgb_to_hex(self, rgb):
-        """Convert RGB tuple (0-1) to hex color string"""
-        r, g, b = [int(c * 255) for c in rgb]
-        return f"#{r:02x}{g:02x}{b:02x}"
-
     def load_default_styles(self):
         """Load default style settings from config file"""
         default_config = {
@@ -637,6 +1421,7 @@ class PDFFormBuilder:
             "font_color": (0, 0, 0),
             "border_width": 1.0,
             "font_size": 12.0,
+            "disk_cache": True,
         }
 
         try:
@@ -658,6 +1443,9 @@ class PDFFormBuilder:
                     self.default_font_size = config.get(
                         "font_size", default_config["font_size"]
                     )
+                    self.disk_cache_enabled = bool(
+                        config.get("disk_cache", default_config["disk_cache"])
+                    )
             else:
                 # Use defaults
                 self.default_border_color = default_config["border_color"]
@@ -665,6 +1453,7 @@ class PDFFormBuilder:
                 self.default_font_color = default_config["font_color"]
                 self.default_border_width = default_config["border_width"]
                 self.default_font_size = default_config["font_size"]
+                self.disk_cache_enabled = default_config["disk_cache"]
         except Exception as e:
             print(f"Error loading config: {e}")
             # Use defaults on error
@@ -673,9 +1462,25 @@ class PDFFormBuilder:
             self.default_font_color = default_config["font_color"]
             self.default_border_width = default_config["border_width"]
             self.default_font_size = default_config["font_size"]
+            self.disk_cache_enabled = default_config["disk_cache"]
+
+    def _default_style_values(self):
+        """Current default styles and settings as a comparable tuple"""
+        return (
+            self.default_border_width,
+            self.default_font_size,
+            tuple(self.default_border_color),
+            tuple(self.default_fill_color),
+            tuple(self.default_font_color),
+            self.disk_cache_enabled,
+        )
 
     def save_default_styles(self):
         """Save default style settings to config file"""
+        if not self._styles_dirty:
+            return
+
+        tmp_path = None
         try:
             config = {
                 "border_color": list(self.default_border_color),
@@ -683,11 +1488,26 @@ class PDFFormBuilder:
                 "font_color": list(self.default_font_color),
                 "border_width": self.default_border_width,
                 "font_size": self.default_font_size,
+                "disk_cache": self.disk_cache_enabled,
             }
-            with open(self.config_file, "w") as f:
-                json.dump(config, f, indent=2)
+            # Write to a temp file and swap it in so a crash can't leave a
+            # half-written config behind
+            with tempfile.NamedTemporaryFile(
+                "wb",
+                dir=os.path.dirname(self.config_file),
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_path = f.name
+                f.write(_dumps(config))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.config_file)
+            self._styles_dirty = False
         except Exception as e:
             print(f"Error saving config: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def open_style_settings(self):
         """Open dialog to configure default style settings"""
@@ -774,7 +1594,7 @@ class PDFFormBuilder:
         border_color_display = tk.Button(
             settings_frame,
             text="Choose Color",
-            bg=self.rgb_to_hex(self.default_border_color),
+            bg=_rgb_to_hex(tuple(self.default_border_color)),
             width=15,
             relief=tk.RAISED,
             bd=2,
@@ -786,7 +1606,7 @@ class PDFFormBuilder:
             from tkinter import colorchooser
 
             color = colorchooser.askcolor(
-                initialcolor=self.rgb_to_hex(border_color_value[0]),
+                initialcolor=_rgb_to_hex(tuple(border_color_value[0])),
                 title="Choose Border Color",
             )
             if color[0]:
@@ -803,7 +1623,7 @@ class PDFFormBuilder:
         fill_color_display = tk.Button(
             settings_frame,
             text="Choose Color",
-            bg=self.rgb_to_hex(self.default_fill_color),
+            bg=_rgb_to_hex(tuple(self.default_fill_color)),
             width=15,
             relief=tk.RAISED,
             bd=2,
@@ -815,7 +1635,7 @@ class PDFFormBuilder:
             from tkinter import colorchooser
 
             color = colorchooser.askcolor(
-                initialcolor=self.rgb_to_hex(fill_color_value[0]),
+                initialcolor=_rgb_to_hex(tuple(fill_color_value[0])),
                 title="Choose Fill Color",
             )
             if color[0]:
@@ -832,7 +1652,7 @@ class PDFFormBuilder:
         font_color_display = tk.Button(
             settings_frame,
             text="Choose Color",
-            bg=self.rgb_to_hex(self.default_font_color),
+            bg=_rgb_to_hex(tuple(self.default_font_color)),
             width=15,
             relief=tk.RAISED,
             bd=2,
@@ -844,7 +1664,7 @@ class PDFFormBuilder:
             from tkinter import colorchooser
 
             color = colorchooser.askcolor(
-                initialcolor=self.rgb_to_hex(font_color_value[0]),
+                initialcolor=_rgb_to_hex(tuple(font_color_value[0])),
                 title="Choose Font Color",
             )
             if color[0]:
@@ -854,6 +1674,23 @@ class PDFFormBuilder:
         font_color_display.config(command=choose_font_color)
         row += 1
 
+        # Disk cache
+        disk_cache_var = tk.BooleanVar(value=self.disk_cache_enabled)
+        ttk.Checkbutton(
+            settings_frame,
+            text="Cache page images on disk",
+            variable=disk_cache_var,
+        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, pady=(10, 0), padx=5)
+        row += 1
+        ttk.Label(
+            settings_frame,
+            text=f"Speeds up reopening PDFs. Images are kept in {self.cache_dir}; "
+            "turning this off deletes them.",
+            wraplength=350,
+            foreground="gray",
+        ).grid(row=row, column=0, columnspan=2, sticky=tk.W, padx=5)
+        row += 1
+
         # Separator
         ttk.Separator(main_frame, orient="horizontal").pack(fill="x", pady=10)
 
@@ -863,11 +1700,16 @@ class PDFFormBuilder:
 
         def save_settings():
             try:
+                previous_styles = self._default_style_values()
                 self.default_border_width = float(border_width_var.get())
                 self.default_font_size = float(font_size_var.get())
                 self.default_border_color = border_color_value[0]
                 self.default_fill_color = fill_color_value[0]
                 self.default_font_color = font_color_value[0]
+                if disk_cache_var.get() != self.disk_cache_enabled:
+                    self.set_disk_cache_enabled(disk_cache_var.get())
+                if self._default_style_values() != previous_styles:
+                    self._styles_dirty = True
 
                 # Save to config file
                 self.save_default_styles()
@@ -896,6 +1738,7 @@ class PDFFormBuilder:
             border_color_display.config(bg="#000000")
             fill_color_display.config(bg="#ffffff")
             font_color_display.config(bg="#000000")
+            disk_cache_var.set(True)
 
         ttk.Button(
             button_frame, text="Save Settings", command=save_settings, width=15
@@ -907,36 +1750,144 @@ class PDFFormBuilder:
             button_frame, text="Cancel", command=settings_window.destroy, width=12
         ).pack(side=tk.LEFT, padx=5)
 
+    def _field_label(self, field):
+        """Text shown for a field in the fields listbox"""
+        return f"[P{field.page_num + 1}] {field.field_type}: {field.name}"
+
     def update_fields_list(self):
         self.fields_listbox.delete(0, tk.END)
-        for i, field in enumerate(self.fields):
-            self.fields_listbox.insert(
-                tk.END, f"[P{field.page_num + 1}] {field.field_type}: {field.name}"
-            )
+        # A single variadic insert is one Tcl call instead of one per field
+        items = [self._field_label(field) for field in self.fields]
+        if items:
+            self.fields_listbox.insert(tk.END, *items)
 
     def delete_field(self):
         selection = self.fields_listbox.curselection()
         if selection:
+            self._flush_appearance_update()
             idx = selection[0]
-            del self.fields[idx]
+            last = len(self.fields) - 1
+            self._fields_by_page[self.fields[idx].page_num].remove(idx)
+
+            # Field order carries no meaning, so fill the gap with the last
+            # field instead of shifting everything after idx down by one
+            if idx != last:
+                moved = self.fields.pop()
+                self.fields[idx] = moved
+                page_fields = self._fields_by_page[moved.page_num]
+                page_fields[page_fields.index(last)] = idx
+
+                self.fields_listbox.delete(last)
+                self.fields_listbox.delete(idx)
+                self.fields_listbox.insert(idx, self._field_label(moved))
+            else:
+                self.fields.pop()
+                self.fields_listbox.delete(idx)
+
             self.selected_field_idx = None
-            self.update_fields_list()
-            self.render_page()
+            self.draw_fields()
             self.info_label.config(text="Select a field to customize")
 
     def clear_all_fields(self):
         if messagebox.askyesno("Confirm", "Delete all fields?"):
+            self._flush_appearance_update()
             self.fields = []
+            self._fields_by_page.clear()
+            self._scanned_pages.clear()
             self.selected_field_idx = None
             self.update_fields_list()
-            self.render_page()
+            self.draw_fields()
             self.info_label.config(text="Select a field to customize")
 
-    def detect_existing_fields(self):
-        """Detect and load existing form fields from the PDF"""
+    def ask_detect_scope(self):
+        """Ask which pages to scan for fields. Returns page indices or None."""
+        page_count = len(self.pdf_doc)
+        result = []
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Detect Fields")
+        dialog.geometry("350x220")
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        frame = ttk.Frame(dialog, padding=20)
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(
+            frame,
+            text=f"Scan which pages of this {page_count}-page PDF for form fields?",
+            wraplength=300,
+        ).pack(anchor=tk.W, pady=(0, 10))
+
+        scope_var = tk.StringVar(value="current")
+        ttk.Radiobutton(
+            frame, text="Current page", variable=scope_var, value="current"
+        ).pack(anchor=tk.W)
+        ttk.Radiobutton(frame, text="All pages", variable=scope_var, value="all").pack(
+            anchor=tk.W
+        )
+
+        range_frame = ttk.Frame(frame)
+        range_frame.pack(anchor=tk.W, fill=tk.X)
+        ttk.Radiobutton(
+            range_frame, text="Pages:", variable=scope_var, value="range"
+        ).pack(side=tk.LEFT)
+        range_var = tk.StringVar(value=f"1-{page_count}")
+        range_entry = ttk.Entry(range_frame, textvariable=range_var, width=20)
+        range_entry.pack(side=tk.LEFT, padx=5)
+        range_entry.bind("<FocusIn>", lambda e: scope_var.set("range"))
+
+        def scan():
+            scope = scope_var.get()
+            if scope == "current":
+                result.extend([self.current_page])
+            elif scope == "all":
+                result.extend(range(page_count))
+            else:
+                try:
+                    result.extend(_parse_page_range(range_var.get(), page_count))
+                except ValueError:
+                    messagebox.showwarning(
+                        "Invalid Range",
+                        f"Enter pages between 1 and {page_count}, e.g. 1-5, 8",
+                        parent=dialog,
+                    )
+                    return
+            dialog.destroy()
+
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(side=tk.BOTTOM, pady=(10, 0))
+        ttk.Button(button_frame, text="Scan", command=scan).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Skip", command=dialog.destroy).pack(
+            side=tk.LEFT, padx=5
+        )
+
+        self.root.wait_window(dialog)
+        return result or None
+
+    def detect_existing_fields(self, page_range=None):
+        """Detect and load existing form fields from the PDF.
+
+        Only the pages in page_range are scanned; without one, the user is
+        asked. Pages already scanned since the last open or clear are skipped.
+        """
         if not self.pdf_doc:
             return
 
+        if page_range is None:
+            page_range = self.ask_detect_scope()
+            if page_range is None:
+                return
+        pages = [p for p in page_range if p not in self._scanned_pages]
+        if not pages:
+            messagebox.showinfo(
+                "Detect Fields",
+                "The selected pages were already scanned for form fields.\n\n"
+                + "Use Clear All to scan them again.",
+                parent=self.root,
+            )
+            return
+
         try:
             detected_count = 0
 
@@ -961,62 +1912,59 @@ class PDFFormBuilder:
 
             progress_window.update()
 
-            total_pages = len(self.pdf_doc)
+            total_pages = len(pages)
             progress_bar["maximum"] = total_pages
 
-            for page_num in range(total_pages):
-                status_label.config(
-                    text=f"Processing page {page_num + 1} of {total_pages}..."
-                )
-                progress_bar["value"] = page_num + 1
-                progress_window.update()
-
-                page = self.pdf_doc[page_num]
-
-                # Get all widgets (form fields) on the page
-                widgets = page.widgets()
-
-                for widget in widgets:
-                    try:
-                        # Extract widget properties
-                        field_name = widget.field_name or f"field_{detected_count + 1}"
-                        field_rect = widget.rect
+            errors = []
 
-                        # Determine field type
-                        field_type = self._get_field_type_from_widget(widget)
+            # Redraw the dialog at most every 100 ms - a full Tk update per
+            # page dominates the scan on long documents
+            last_update = time.monotonic()
 
-                        # Extract appearance properties
-                        border_color = (
-                            widget.border_color if widget.border_color else (0, 0, 0)
+            with self._fitz_lock:
+                for scanned, page_num in enumerate(pages, 1):
+                    progress_bar["value"] = scanned
+                    now = time.monotonic()
+                    if now - last_update >= 0.1:
+                        status_label.config(
+                            text=f"Processing page {page_num + 1} "
+                            f"({scanned} of {total_pages})..."
                         )
-                        fill_color = (
-                            widget.fill_color if widget.fill_color else (1, 1, 1)
-                        )
-                        border_width = (
-                            widget.border_width if widget.border_width else 1.0
-                        )
-                        font_size = (
-                            widget.text_fontsize if widget.text_fontsize else 12.0
-                        )
-                        font_color = (
-                            widget.text_color if widget.text_color else (0, 0, 0)
-                        )
-
-                        # Get max chars for comb fields
-                        max_chars = 0
-                        if widget.field_type == fitz.PDF_WIDGET_TYPE_TEXT:
-                            max_chars = widget.text_maxlen or 0
-
-                        # Create FormField object
+                        # Only flush redraws - dispatching input events here
+                        # could re-enter handlers mid-scan
+                        progress_window.update_idletasks()
+                        last_update = now
+
+                    # Pages are only parsed once per document; scanning them
+                    # again after Clear All reuses the snapshots
+                    snapshots = self._widget_cache.get(page_num)
+                    if snapshots is None:
+                        # A page is added whole or not at all: a malformed
+                        # widget leaves it unscanned so Detect can retry it.
+                        # Errors are reported together once the scan is done.
+                        try:
+                            snapshots = self._read_page_widgets(page_num)
+                        except Exception as e:
+                            errors.append((page_num, e))
+                            continue
+                        self._widget_cache[page_num] = snapshots
+                    self._scanned_pages.add(page_num)
+
+                    for (
+                        field_type,
+                        rect,
+                        field_name,
+                        max_chars,
+                        border_color,
+                        fill_color,
+                        border_width,
+                        font_size,
+                        font_color,
+                    ) in snapshots:
                         field = FormField(
                             field_type=field_type,
-                            rect=(
-                                field_rect.x0,
-                                field_rect.y0,
-                                field_rect.x1,
-                                field_rect.y1,
-                            ),
-                            name=field_name,
+                            rect=rect,
+                            name=field_name or self._next_field_name("field"),
                             page_num=page_num,
                             max_chars=max_chars,
                             border_color=border_color,
@@ -1025,19 +1973,22 @@ class PDFFormBuilder:
                             font_size=font_size,
                             font_color=font_color,
                         )
-
-                        self.fields.append(field)
+                        self.add_field(field)
                         detected_count += 1
 
-                    except Exception as e:
-                        print(f"Error processing widget: {str(e)}")
-                        continue
+            if errors:
+                print(
+                    "Error processing widgets:\n"
+                    + "\n".join(f"  page {p + 1}: {e}" for p, e in errors)
+                )
 
+            status_label.config(text=f"Processed {total_pages} of {total_pages} pages")
+            progress_window.update_idletasks()
             progress_window.destroy()
 
             if detected_count > 0:
                 self.update_fields_list()
-                self.render_page()
+                self.draw_fields()
                 messagebox.showinfo(
                     "Fields Detected",
                     f"Found {detected_count} existing form field(s).\n\n"
@@ -1050,41 +2001,53 @@ class PDFFormBuilder:
             print(f"Field detection error: {str(e)}")
             # Don't show error dialog - just continue without loading fields
 
-    def _get_field_type_from_widget(self, widget):
-        """Determine our field type from PyMuPDF widget type"""
-        widget_type = widget.field_type
+    def _read_page_widgets(self, page_num):
+        """Snapshot the form fields on a page as FormField arguments"""
+        page = self.pdf_doc[page_num]
+
+        # Most pages carry no form fields; checking for a first widget is
+        # far cheaper than walking page.widgets()
+        if not page.first_widget:
+            return []
+
+        snapshots = []
+        for widget in page.widgets():
+            # Read each widget property once
+            field_rect = widget.rect
+            border_color = widget.border_color
+            fill_color = widget.fill_color
+            border_width = widget.border_width
+            font_size = widget.text_fontsize
+            font_color = widget.text_color
+            widget_type = widget.field_type
+
+            # Get max chars for comb fields
+            max_chars = 0
+            if widget_type == fitz.PDF_WIDGET_TYPE_TEXT:
+                max_chars = widget.text_maxlen or 0
+
+            snapshots.append(
+                (
+                    self._get_field_type_from_widget(widget, widget_type),
+                    (field_rect.x0, field_rect.y0, field_rect.x1, field_rect.y1),
+                    widget.field_name,
+                    max_chars,
+                    # Colors become tuples so fields built from the same
+                    # snapshot never share a list
+                    tuple(border_color) if border_color else (0, 0, 0),
+                    tuple(fill_color) if fill_color else (1, 1, 1),
+                    border_width or 1.0,
+                    font_size or 12.0,
+                    tuple(font_color) if font_color else (0, 0, 0),
+                )
+            )
+        return snapshots
 
+    def _get_field_type_from_widget(self, widget, widget_type):
+        """Determine our field type from PyMuPDF widget type"""
         if widget_type == fitz.PDF_WIDGET_TYPE_TEXT:
-            # Check for multiline or comb flags
-            field_flags = widget.field_flags if hasattr(widget, "field_flags") else 0
-
-            if field_flags & fitz.PDF_TX_FIELD_IS_COMB:
-                return "comb"
-            elif field_flags & fitz.PDF_TX_FIELD_IS_MULTILINE:
-                # Distinguish between multiline and textarea based on size
-                rect = widget.rect
-                height = rect.y1 - rect.y0
-                if height > 50:
-                    return "textarea"
-                else:
-                    return "multiline"
-            else:
-                return "text"
-
-        elif widget_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
-            return "checkbox"
-
-        elif widget_type == fitz.PDF_WIDGET_TYPE_RADIOBUTTON:
-            return "radio"
-
-        elif widget_type == fitz.PDF_WIDGET_TYPE_COMBOBOX:
-            return "text"  # Treat as text field
-
-        elif widget_type == fitz.PDF_WIDGET_TYPE_LISTBOX:
-            return "textarea"  # Treat as text area
-
-        else:
-            return "text"  # Default to text field
+            return _text_subtype(widget)
+        return _WIDGET_TYPE_MAP.get(widget_type, "text")  # Default to text field
 
     def go_to_page(self):
         try:
@@ -1113,55 +2076,54 @@ class PDFFormBuilder:
         if filename:
             try:
                 # Create a new PDF with form fields
-                output_doc = fitz.open(self.pdf_doc.name)
-
-                for field in self.fields:
-                    page = output_doc[field.page_num]
-
-                    # Create widget based on field type
-                    widget = fitz.Widget()
-                    widget.field_name = field.name
-                    widget.rect = fitz.Rect(field.rect)
-                    widget.border_width = field.border_width
-                    widget.border_color = field.border_color
-                    widget.fill_color = field.fill_color
-                    widget.text_font = "helv"
-                    widget.text_fontsize = field.font_size
-                    widget.text_color = field.font_color
-
-                    if field.field_type == "text":
-                        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-                        widget.text_maxlen = 0
-
-                    elif field.field_type == "multiline":
-                        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-                        widget.field_flags = fitz.PDF_TX_FIELD_IS_MULTILINE
-                        widget.text_maxlen = 0
-
-                    elif field.field_type == "textarea":
-                        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-                        widget.field_flags = fitz.PDF_TX_FIELD_IS_MULTILINE
-                        widget.text_maxlen = 0
-
-                    elif field.field_type == "checkbox":
-                        widget.field_type = fitz.PDF_WIDGET_TYPE_CHECKBOX
-                        widget.field_value = "Off"
-
-                    elif field.field_type == "comb":
-                        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
-                        widget.field_flags = fitz.PDF_TX_FIELD_IS_COMB
-                        widget.text_maxlen = field.max_chars
-
-                    elif field.field_type == "radio":
-                        widget.field_type = fitz.PDF_WIDGET_TYPE_RADIOBUTTON
-                        widget.field_value = "Off"
-
-                    # Add widget to page
-                    annot = page.add_widget(widget)
-
-                # Save the output PDF
-                output_doc.save(filename)
-                output_doc.close()
+                with self._fitz_lock:
+                    output_doc = fitz.open(self.pdf_doc.name)
+
+                    # Bound once up front - they are looked up for every field
+                    fields = self.fields
+                    Widget = fitz.Widget
+                    Rect = fitz.Rect
+                    widget_spec = _WIDGET_SPEC
+                    IS_COMB = fitz.PDF_TX_FIELD_IS_COMB
+
+                    # Walk the per-page index so each page is fetched once
+                    for page_num, page_fields in sorted(self._fields_by_page.items()):
+                        if not page_fields:
+                            continue
+                        page = output_doc[page_num]
+
+                        for i in page_fields:
+                            field = fields[i]
+
+                            # Create widget based on field type
+                            widget = Widget()
+                            widget.field_name = field.name
+                            widget.rect = Rect(field.rect)
+                            widget.border_width = field.border_width
+                            widget.border_color = field.border_color
+                            widget.fill_color = field.fill_color
+                            widget.text_font = "helv"
+                            widget.text_fontsize = field.font_size
+                            widget.text_color = field.font_color
+
+                            widget_type, flags, value = widget_spec[field.field_type]
+                            widget.field_type = widget_type
+                            if flags:
+                                widget.field_flags = flags
+                            if value is None:
+                                # Text fields - only comb fields have a length
+                                widget.text_maxlen = (
+                                    field.max_chars if flags & IS_COMB else 0
+                                )
+                            else:
+                                widget.field_value = value
+
+                            # Add widget to page
+                            annot = page.add_widget(widget)
+
+                    # Save the output PDF
+                    output_doc.save(filename)
+                    output_doc.close()
 
                 messagebox.showinfo(
                     "Success",